@@ -20,6 +20,7 @@ config.set_main_option("sqlalchemy.url", DATABASE_URL)
 from src.database import Base
 from src.models.user import User
 from src.models.task import Task
+from src.models.task_archive import TaskArchive
 
 # Устанавливаем метаданные для автогенерации миграций
 target_metadata = Base.metadata
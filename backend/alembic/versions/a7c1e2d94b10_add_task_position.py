@@ -0,0 +1,46 @@
+"""Add task position
+
+Revision ID: a7c1e2d94b10
+Revises: f4a3ca417396
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.utils.ordering import spread_keys
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e2d94b10'
+down_revision: Union[str, None] = 'f4a3ca417396'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('position', sa.String(length=255, collation='C'), nullable=True))
+
+    # Заполняем позиции существующих задач в порядке их создания
+    conn = op.get_bind()
+    rows = conn.execute(sa.text('SELECT id, user_id FROM tasks ORDER BY user_id, id')).fetchall()
+    by_user = {}
+    for task_id, user_id in rows:
+        by_user.setdefault(user_id, []).append(task_id)
+    for task_ids in by_user.values():
+        conn.execute(
+            sa.text('UPDATE tasks SET position = :position WHERE id = :id'),
+            [{'id': task_id, 'position': position} for task_id, position in zip(task_ids, spread_keys(len(task_ids)))]
+        )
+
+    op.alter_column('tasks', 'position', nullable=False)
+    op.create_index('ix_tasks_user_id_position', 'tasks', ['user_id', 'position'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_user_id_position', table_name='tasks')
+    op.drop_column('tasks', 'position')
@@ -0,0 +1,53 @@
+"""Add tasks archive
+
+Revision ID: c3e8b5f21a77
+Revises: a7c1e2d94b10
+Create Date: 2026-10-19 12:40:07.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8b5f21a77'
+down_revision: Union[str, None] = 'a7c1e2d94b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('completed_at', sa.DateTime(), nullable=True))
+    # Время выполнения старых задач неизвестно - отсчитываем срок архивации от миграции
+    op.execute('UPDATE tasks SET completed_at = now() WHERE completed')
+    op.create_index('ix_tasks_completed_at', 'tasks', ['completed_at'], unique=False, postgresql_where=sa.text('completed'))
+
+    op.create_table('tasks_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('completed', sa.Boolean(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('position', sa.String(length=255, collation='C'), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tasks_archive_user_id_position', 'tasks_archive', ['user_id', 'position'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Возвращаем архивные задачи в рабочую таблицу, чтобы не потерять данные
+    op.execute(
+        'INSERT INTO tasks (id, user_id, title, description, completed, position) '
+        'SELECT id, user_id, title, description, completed, position FROM tasks_archive'
+    )
+    op.drop_index('ix_tasks_archive_user_id_position', table_name='tasks_archive')
+    op.drop_table('tasks_archive')
+    op.drop_index('ix_tasks_completed_at', table_name='tasks')
+    op.drop_column('tasks', 'completed_at')
@@ -0,0 +1,45 @@
+"""Размер ответа GET /tasks/ и стоимость сжатия в зависимости от длины списка.
+
+Запуск: python -m benchmarks.bench_compression
+"""
+import json
+import time
+
+from src.middleware.compression import COMPRESSORS
+from src.utils.ordering import spread_keys
+
+SIZES = [10, 100, 1_000, 10_000]
+REPEAT = 20
+
+
+def task_list_payload(count: int) -> bytes:
+    tasks = [
+        {
+            "id": i,
+            "title": f"Task number {i}",
+            "description": f"Description of task {i}: buy milk, call mom, finish the report",
+            "completed": i % 3 == 0,
+            "position": position,
+            "archived": False,
+        }
+        for i, position in enumerate(spread_keys(count), start=1)
+    ]
+    return json.dumps(tasks).encode()
+
+
+def main():
+    print(f"{'tasks':>7} {'raw':>10} " + " ".join(f"{name + ' bytes':>11} {name + ' ms':>8}" for name in COMPRESSORS))
+    for size in SIZES:
+        payload = task_list_payload(size)
+        row = f"{size:>7} {len(payload):>10} "
+        for name, compressor in COMPRESSORS.items():
+            started = time.perf_counter()
+            for _ in range(REPEAT):
+                compressed = compressor().compress(payload, final=True)
+            elapsed = (time.perf_counter() - started) / REPEAT
+            row += f"{len(compressed):>11} {elapsed * 1e3:>8.2f} "
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Влияние архивации на горячие запросы при больших объёмах.
+
+Заполняет базу из DATABASE_URL синтетическими пользователями и задачами
+(по умолчанию 10M задач, 90% выполнены давно), меряет размер tasks и время
+выборки списка задач пользователя до и после архивации, затем удаляет
+тестовые данные. Запускать только на отдельной базе!
+
+Запуск: python -m benchmarks.bench_task_archive --rows 10000000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.config import settings
+from src.repository.task_archive_repository import TaskArchiveRepository
+
+USER_PREFIX = "bench_archive_"
+
+
+async def seed(conn, rows: int, users: int, completed_ratio: float):
+    await conn.execute(text(
+        "INSERT INTO users (username, password_hash) "
+        "SELECT :prefix || n, 'x' FROM generate_series(1, :users) AS n"
+    ), {"prefix": USER_PREFIX, "users": users})
+    await conn.execute(text(
+        "INSERT INTO tasks (user_id, title, description, completed, completed_at, position) "
+        "SELECT u.id, 'task ' || n, 'description', c, "
+        "       CASE WHEN c THEN now() - interval '60 days' END, lpad(n::text, 9, '1') "
+        "FROM generate_series(1, :rows) AS n "
+        "CROSS JOIN LATERAL (SELECT random() < :ratio AS c) AS r "
+        "JOIN users u ON u.username = :prefix || (n % :users + 1)"
+    ), {"rows": rows, "users": users, "ratio": completed_ratio, "prefix": USER_PREFIX})
+    await conn.execute(text("ANALYZE tasks"))
+
+
+async def measure(conn, user_ids, samples: int):
+    size = (await conn.execute(text("SELECT pg_total_relation_size('tasks')"))).scalar_one()
+    timings = []
+    for user_id in random.sample(user_ids, min(samples, len(user_ids))):
+        started = time.perf_counter()
+        await conn.execute(
+            text("SELECT * FROM tasks WHERE user_id = :user_id ORDER BY position, id"),
+            {"user_id": user_id}
+        )
+        timings.append(time.perf_counter() - started)
+    return size, statistics.median(timings), max(timings)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--completed-ratio", type=float, default=0.9)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.database_url.replace('postgresql://', 'postgresql+asyncpg://'))
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with engine.begin() as conn:
+            started = time.perf_counter()
+            await seed(conn, args.rows, args.users, args.completed_ratio)
+            print(f"seeded {args.rows} tasks in {time.perf_counter() - started:.1f}s")
+
+        async with engine.connect() as conn:
+            user_ids = list((await conn.execute(
+                text("SELECT id FROM users WHERE username LIKE :prefix"), {"prefix": USER_PREFIX + "%"}
+            )).scalars())
+            size, median, worst = await measure(conn, user_ids, args.samples)
+            print(f"before: tasks={size / 2**20:.0f}MiB list median={median * 1e3:.2f}ms max={worst * 1e3:.2f}ms")
+
+        started = time.perf_counter()
+        archived = 0
+        completed_before = datetime.utcnow() - timedelta(days=30)
+        while True:
+            async with session_factory() as session:
+                moved = await TaskArchiveRepository(session).archive_completed(completed_before, args.batch_size)
+            archived += moved
+            if moved < args.batch_size:
+                break
+        elapsed = time.perf_counter() - started
+        print(f"archived {archived} tasks in {elapsed:.1f}s ({archived / elapsed:.0f} rows/s)")
+
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM ANALYZE tasks"))
+        async with engine.connect() as conn:
+            size, median, worst = await measure(conn, user_ids, args.samples)
+            print(f"after:  tasks={size / 2**20:.0f}MiB list median={median * 1e3:.2f}ms max={worst * 1e3:.2f}ms")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text("DELETE FROM users WHERE username LIKE :prefix"), {"prefix": USER_PREFIX + "%"})
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
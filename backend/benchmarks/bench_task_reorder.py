@@ -0,0 +1,43 @@
+"""Генерация ключей порядка при перемещении задач в зависимости от размера списка.
+
+Меряет только src.utils.ordering в памяти: время вычисления ключа для
+случайного перемещения и рост длины ключей. В БД не обращается - каждое
+перемещение в приложении пишет одну строку; стоимость в БД - см.
+benchmarks/bench_task_reorder_db.py.
+
+Запуск: python -m benchmarks.bench_task_reorder
+"""
+import random
+import time
+
+from src.utils.ordering import key_between, spread_keys
+
+SIZES = [10, 100, 1_000, 10_000]
+MOVES = 2_000
+
+
+def bench_key_generation(size: int, rng: random.Random):
+    keys = spread_keys(size)
+    elapsed = 0.0
+    for _ in range(MOVES):
+        keys.pop(rng.randrange(size))
+        new = rng.randrange(size)
+        lower = keys[new - 1] if new > 0 else None
+        upper = keys[new] if new < len(keys) else None
+        started = time.perf_counter()
+        key = key_between(lower, upper)
+        elapsed += time.perf_counter() - started
+        keys.insert(new, key)
+    return elapsed, max(len(k) for k in keys)
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'tasks':>8} {'us/key':>8} {'max key len':>12}")
+    for size in SIZES:
+        elapsed, key_len = bench_key_generation(size, rng)
+        print(f"{size:>8} {elapsed / MOVES * 1e6:>8.2f} {key_len:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Стоимость перемещения задачи в БД в зависимости от размера списка.
+
+Для каждого размера создаёт пользователя с задачами и выполняет случайные
+перемещения через TaskService.move_task (дробные ключи), а рядом - ту же
+серию перемещений с плотной целочисленной нумерацией, где перемещение сдвигает
+все строки между старой и новой позицией. Считает записанные строки (rowcount
+всех UPDATE) и задержку одного перемещения, затем удаляет тестовые данные.
+Запускать только на отдельной базе!
+
+Запуск: python -m benchmarks.bench_task_reorder_db --sizes 100 1000 10000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.config import settings
+from src.dto.task import TaskMove
+from src.services.task_service import TaskService
+from src.utils.ordering import spread_keys
+
+USER_PREFIX = "bench_reorder_"
+
+
+class RowCounter:
+    def __init__(self):
+        self.rows = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE") and cursor.rowcount > 0:
+            self.rows += cursor.rowcount
+
+
+async def seed(conn, size: int) -> int:
+    user_id = (await conn.execute(text(
+        "INSERT INTO users (username, password_hash) VALUES (:username, 'x') RETURNING id"
+    ), {"username": f"{USER_PREFIX}{size}"})).scalar_one()
+    await conn.execute(
+        text(
+            "INSERT INTO tasks (user_id, title, description, completed, position) "
+            "VALUES (:user_id, :title, '', false, :position)"
+        ),
+        [{"user_id": user_id, "title": f"task {i}", "position": position}
+         for i, position in enumerate(spread_keys(size))]
+    )
+    await conn.execute(text(
+        "INSERT INTO bench_reorder_int (id, user_id, pos) "
+        "SELECT id, user_id, row_number() OVER (ORDER BY position) FROM tasks WHERE user_id = :user_id"
+    ), {"user_id": user_id})
+    await conn.execute(text("ANALYZE tasks"))
+    await conn.execute(text("ANALYZE bench_reorder_int"))
+    return user_id
+
+
+async def move_fractional(session_factory, task_id: int, after_id: int):
+    async with session_factory() as session:
+        task_service = TaskService(session)
+        task = await task_service.get_task(task_id)
+        await task_service.move_task(task, TaskMove(after_id=after_id))
+
+
+async def move_integer(engine, task_id: int, after_id: int):
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "SELECT id FROM users WHERE id = (SELECT user_id FROM bench_reorder_int WHERE id = :id) "
+            "FOR NO KEY UPDATE"
+        ), {"id": task_id})
+        rows = (await conn.execute(text(
+            "SELECT id, user_id, pos FROM bench_reorder_int WHERE id IN (:id, :after_id)"
+        ), {"id": task_id, "after_id": after_id})).all()
+        by_id = {row.id: row for row in rows}
+        user_id, old, target = by_id[task_id].user_id, by_id[task_id].pos, by_id[after_id].pos
+        if target > old:
+            new = target
+            await conn.execute(text(
+                "UPDATE bench_reorder_int SET pos = pos - 1 WHERE user_id = :user_id AND pos > :old AND pos <= :new"
+            ), {"user_id": user_id, "old": old, "new": new})
+        else:
+            new = target + 1
+            await conn.execute(text(
+                "UPDATE bench_reorder_int SET pos = pos + 1 WHERE user_id = :user_id AND pos >= :new AND pos < :old"
+            ), {"user_id": user_id, "old": old, "new": new})
+        await conn.execute(text("UPDATE bench_reorder_int SET pos = :new WHERE id = :id"), {"id": task_id, "new": new})
+
+
+async def run_moves(move, moves, counter: RowCounter):
+    counter.rows = 0
+    timings = []
+    for task_id, after_id in moves:
+        started = time.perf_counter()
+        await move(task_id, after_id)
+        timings.append(time.perf_counter() - started)
+    return counter.rows / len(moves), statistics.median(timings), max(timings)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--moves", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.database_url.replace('postgresql://', 'postgresql+asyncpg://'))
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    counter = RowCounter()
+    event.listen(engine.sync_engine, "after_cursor_execute", counter)
+    rng = random.Random(42)
+
+    print(f"{'tasks':>8} {'rows/move keys':>15} {'rows/move int':>14} "
+          f"{'keys med ms':>12} {'keys max ms':>12} {'int med ms':>11} {'int max ms':>11}")
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "CREATE TABLE bench_reorder_int (id integer PRIMARY KEY, user_id integer NOT NULL, pos integer NOT NULL)"
+            ))
+            await conn.execute(text("CREATE INDEX ON bench_reorder_int (user_id, pos)"))
+
+        for size in args.sizes:
+            async with engine.begin() as conn:
+                user_id = await seed(conn, size)
+                task_ids = list((await conn.execute(
+                    text("SELECT id FROM tasks WHERE user_id = :user_id"), {"user_id": user_id}
+                )).scalars())
+            moves = [tuple(rng.sample(task_ids, 2)) for _ in range(args.moves)]
+
+            keys = await run_moves(lambda t, a: move_fractional(session_factory, t, a), moves, counter)
+            ints = await run_moves(lambda t, a: move_integer(engine, t, a), moves, counter)
+            print(f"{size:>8} {keys[0]:>15.1f} {ints[0]:>14.1f} "
+                  f"{keys[1] * 1e3:>12.2f} {keys[2] * 1e3:>12.2f} {ints[1] * 1e3:>11.2f} {ints[2] * 1e3:>11.2f}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP TABLE IF EXISTS bench_reorder_int"))
+            await conn.execute(text("DELETE FROM users WHERE username LIKE :prefix"), {"prefix": USER_PREFIX + "%"})
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,16 +1,17 @@
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic_core import ErrorDetails
 
 from src.auth.dependencies import get_user_service
 from src.dto.user import LoginRequest, UserCreate, UserResponse
-from src.auth.security import Token, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
-from src.services.user_service import UserService
+from src.auth.security import Token, create_access_token, password_needs_rehash, ACCESS_TOKEN_EXPIRE_MINUTES
+from src.services.user_service import UserService, rehash_user_password
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @router.post("/login", response_model=Token)
 async def login_for_access_token(
     login_data: LoginRequest,
+    background_tasks: BackgroundTasks,
     user_service: UserService = Depends(get_user_service),
 ):
     user = await user_service.authenticate_user(login_data.username, login_data.password)
@@ -20,6 +21,10 @@ async def login_for_access_token(
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    # Хеш старой схемы или стоимости обновляем после ответа клиенту
+    if password_needs_rehash(user.password_hash):
+        background_tasks.add_task(rehash_user_password, user.id, user.password_hash, login_data.password)
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -0,0 +1,81 @@
+"""Подбор стоимости хеширования паролей под целевое время проверки на этом хосте.
+
+Запуск: python -m src.auth.calibrate_password_hash --target-ms 250
+        python -m src.auth.calibrate_password_hash --scheme argon2 --memory-cost 65536
+
+Печатает строки для .env. Выбирается наибольшая стоимость, при которой
+медианное время verify не превышает цель.
+"""
+import argparse
+import statistics
+import time
+
+from src.config import settings
+from src.auth.security import create_pwd_context
+
+PASSWORD = "calibration-password"
+
+
+def measure_verify_ms(context, samples: int) -> float:
+    hashed = context.hash(PASSWORD)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.verify(PASSWORD, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(target_ms: float, samples: int) -> int:
+    best = 4
+    for rounds in range(4, 32):
+        elapsed = measure_verify_ms(create_pwd_context("bcrypt", bcrypt_rounds=rounds), samples)
+        print(f"bcrypt rounds={rounds}: {elapsed:.1f} ms")
+        if elapsed > target_ms:
+            break
+        best = rounds
+    return best
+
+
+def calibrate_argon2(target_ms: float, samples: int, memory_cost: int, parallelism: int) -> int:
+    best = 1
+    for time_cost in range(1, 64):
+        context = create_pwd_context(
+            "argon2",
+            argon2_time_cost=time_cost,
+            argon2_memory_cost=memory_cost,
+            argon2_parallelism=parallelism,
+        )
+        elapsed = measure_verify_ms(context, samples)
+        print(f"argon2id t={time_cost} m={memory_cost} p={parallelism}: {elapsed:.1f} ms")
+        if elapsed > target_ms:
+            break
+        best = time_cost
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate password hash cost")
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default=settings.password_hash_scheme)
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--memory-cost", type=int, default=settings.password_argon2_memory_cost)
+    parser.add_argument("--parallelism", type=int, default=settings.password_argon2_parallelism)
+    args = parser.parse_args()
+
+    if args.scheme == "bcrypt":
+        rounds = calibrate_bcrypt(args.target_ms, args.samples)
+        print()
+        print("PASSWORD_HASH_SCHEME=bcrypt")
+        print(f"PASSWORD_BCRYPT_ROUNDS={rounds}")
+    else:
+        time_cost = calibrate_argon2(args.target_ms, args.samples, args.memory_cost, args.parallelism)
+        print()
+        print("PASSWORD_HASH_SCHEME=argon2")
+        print(f"PASSWORD_ARGON2_TIME_COST={time_cost}")
+        print(f"PASSWORD_ARGON2_MEMORY_COST={args.memory_cost}")
+        print(f"PASSWORD_ARGON2_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
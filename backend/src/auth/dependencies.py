@@ -1,4 +1,4 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,9 +12,15 @@ from src.auth.security import TokenData
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
 async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     user_service: UserService = Depends(get_user_service),
 ) -> User:
+    # Подзапросы /batch уже аутентифицированы родительским запросом
+    batch_user = request.scope.get("batch_user")
+    if batch_user is not None:
+        return batch_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
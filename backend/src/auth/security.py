@@ -10,8 +10,39 @@ from src.config import settings
 SECRET_KEY = settings.jwt_secret_key
 ACCESS_TOKEN_EXPIRE_MINUTES = 720
 
+PASSWORD_HASH_SCHEMES = ["bcrypt", "argon2"]
+
+
+def create_pwd_context(
+    scheme: str = settings.password_hash_scheme,
+    bcrypt_rounds: int = settings.password_bcrypt_rounds,
+    argon2_time_cost: int = settings.password_argon2_time_cost,
+    argon2_memory_cost: int = settings.password_argon2_memory_cost,
+    argon2_parallelism: int = settings.password_argon2_parallelism,
+) -> CryptContext:
+    """Контекст хеширования: новые хеши - выбранной схемой и стоимостью.
+
+    Хеши другой схемы или с другими параметрами продолжают проверяться,
+    но needs_update() для них возвращает True, и они перехешируются при входе.
+    """
+    if scheme not in PASSWORD_HASH_SCHEMES:
+        raise ValueError(f"Unsupported password hash scheme: {scheme}")
+    return CryptContext(
+        schemes=[scheme] + [other for other in PASSWORD_HASH_SCHEMES if other != scheme],
+        default=scheme,
+        deprecated="auto",
+        bcrypt__default_rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__type="ID",
+        argon2__time_cost=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = create_pwd_context()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -28,6 +59,9 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+def password_needs_rehash(hashed_password):
+    return pwd_context.needs_update(hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -15,5 +15,25 @@ class Settings(BaseSettings):
     jwt_secret_key: str
     ALGORITHM:str
 
+    task_position_max_length: int = 48
+
+    task_archive_after_days: int = 30
+    task_archive_batch_size: int = 1000
+    task_archive_interval_seconds: int = 3600
+
+    batch_max_requests: int = 20
+    batch_max_concurrency: int = 5
+    batch_timeout_seconds: float = 10.0
+
+    compression_minimum_size: int = 1024
+    compression_offload_size: int = 64 * 1024
+
+    # "bcrypt" или "argon2" (argon2id, нужен пакет argon2-cffi)
+    password_hash_scheme: str = "bcrypt"
+    password_bcrypt_rounds: int = 12
+    password_argon2_time_cost: int = 3
+    password_argon2_memory_cost: int = 65536  # KiB
+    password_argon2_parallelism: int = 4
+
 
 settings = Settings()
@@ -1,3 +1,4 @@
+from fastapi import Request
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from src.config import settings
@@ -27,8 +28,18 @@ async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-async def get_db():
+async def get_db(request: Request):
     """Dependency для получения асинхронной сессии базы данных"""
+    # Подзапросы /batch используют общую сессию родительского запроса
+    batch_session = request.scope.get("batch_session")
+    if batch_session is not None:
+        try:
+            yield batch_session
+        except Exception:
+            # Ошибка одного подзапроса не должна ломать сессию для следующих
+            await batch_session.rollback()
+            raise
+        return
     async with async_session() as session:
         try:
             yield session
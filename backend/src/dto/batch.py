@@ -0,0 +1,22 @@
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class BatchItem(BaseModel):
+    method: Literal["GET", "POST", "PUT", "DELETE"]
+    path: str
+    body: Optional[Any] = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+    # По умолчанию подзапросы выполняются по очереди в одной сессии БД;
+    # concurrent=True выполняет их параллельно, каждый со своей сессией
+    concurrent: bool = False
+
+class BatchItemResponse(BaseModel):
+    status: int
+    body: Optional[Any] = None
+
+class BatchResponse(BaseModel):
+    responses: List[BatchItemResponse]
@@ -9,6 +9,8 @@ class Task(BaseModel):
     title: str
     description: str
     completed: bool
+    position: str
+    archived: bool = False
 
 class TaskCreate(BaseModel):
     title: str
@@ -17,4 +19,9 @@ class TaskCreate(BaseModel):
 class TaskUpdate(BaseModel):
     title: str
     description: str
-    completed: bool
\ No newline at end of file
+    completed: bool
+
+class TaskMove(BaseModel):
+    # Задача встанет сразу после after_id и/или сразу перед before_id
+    after_id: Optional[int] = None
+    before_id: Optional[int] = None
@@ -0,0 +1,67 @@
+"""Перенос выполненных задач из tasks в tasks_archive.
+
+Запускается фоном из приложения (см. src.main) или вручную для разового
+бэкфилла: python -m src.jobs.archive_tasks --older-than-days 0
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.config import settings
+from src.database import async_session
+from src.repository.task_archive_repository import TaskArchiveRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def archive_completed_tasks(
+    older_than: timedelta,
+    batch_size: int,
+    max_batches: Optional[int] = None,
+) -> int:
+    """Архивировать пачками, каждая пачка в своей транзакции и сессии"""
+    completed_before = datetime.utcnow() - older_than
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        async with async_session() as session:
+            archived = await TaskArchiveRepository(session).archive_completed(completed_before, batch_size)
+        total += archived
+        batches += 1
+        if archived < batch_size:
+            break
+    return total
+
+
+async def run_archiver() -> None:
+    """Периодическая архивация, пока работает приложение"""
+    while True:
+        try:
+            archived = await archive_completed_tasks(
+                timedelta(days=settings.task_archive_after_days),
+                settings.task_archive_batch_size,
+            )
+            if archived:
+                logger.info("Archived %d completed tasks", archived)
+        except Exception:
+            logger.exception("Task archiving failed")
+        await asyncio.sleep(settings.task_archive_interval_seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive completed tasks")
+    parser.add_argument("--older-than-days", type=float, default=settings.task_archive_after_days)
+    parser.add_argument("--batch-size", type=int, default=settings.task_archive_batch_size)
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    archived = asyncio.run(archive_completed_tasks(
+        timedelta(days=args.older_than_days), args.batch_size, args.max_batches
+    ))
+    print(f"Archived {archived} tasks")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,31 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import settings
+from src.middleware.compression import CompressionMiddleware
 from src.routers.task_router import router as tasks_router
 from src.routers.user_router import router as user_router
 from src.auth.auth_router import router as auth_router
-app = FastAPI()
+from src.routers.batch_router import router as batch_router
+from src.jobs.archive_tasks import run_archiver
+from src.utils.singleflight import flights
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    archiver = None
+    if settings.task_archive_interval_seconds > 0:
+        archiver = asyncio.create_task(run_archiver())
+    yield
+    if archiver is not None:
+        archiver.cancel()
+        with suppress(asyncio.CancelledError):
+            await archiver
+
+app = FastAPI(lifespan=lifespan)
 
 # Настройка CORS
 app.add_middleware(
@@ -17,10 +37,21 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    offload_size=settings.compression_offload_size
+)
+
 @app.get("/")
 def read_root():
     return {"message": f"Hello!"}
 
+@app.get("/metrics/singleflight")
+def read_singleflight_metrics():
+    return {name: flight.stats() for name, flight in flights.items()}
+
 app.include_router(auth_router)
 app.include_router(tasks_router)
 app.include_router(user_router)
+app.include_router(batch_router)
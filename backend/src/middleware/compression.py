@@ -0,0 +1,181 @@
+"""Сжатие ответов с выбором алгоритма по Accept-Encoding.
+
+gzip доступен всегда, brotli и zstd - если установлены пакеты Brotli и
+zstandard. Маленькие ответы не сжимаются, потоковые ответы сжимаются по
+частям со сбросом после каждого чанка, а сжатие больших тел выносится из
+event loop в пул потоков.
+"""
+import zlib
+from typing import Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+class GzipCompressor:
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int = 4):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        body = self._compressor.process(data)
+        return body + (self._compressor.finish() if final else self._compressor.flush())
+
+
+class ZstdCompressor:
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        body = self._compressor.compress(data)
+        if final:
+            return body + self._compressor.flush()
+        return body + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+
+# В порядке предпочтения сервера при равных q у клиента
+COMPRESSORS: Dict[str, Callable[[], object]] = {}
+if zstandard is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+if brotli is not None:
+    COMPRESSORS["br"] = BrotliCompressor
+COMPRESSORS["gzip"] = GzipCompressor
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Выбрать поддерживаемый алгоритм с наибольшим q из Accept-Encoding"""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        param_name, _, value = params.strip().partition("=")
+        if param_name.strip() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in COMPRESSORS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, offload_size: int = 64 * 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self.app, encoding, self.minimum_size, self.offload_size)
+        await responder(scope, receive, send)
+
+
+class CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int, offload_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        self.compressor = None
+        self.passthrough = False
+        self.started = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def compress(self, data: bytes, final: bool) -> bytes:
+        if len(data) >= self.offload_size:
+            return await run_in_threadpool(self.compressor.compress, data, final)
+        return self.compressor.compress(data, final)
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Заголовки отправим, когда станет ясно, будем ли сжимать
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith(EXCLUDED_CONTENT_TYPES)
+            )
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            if not more_body and len(body) < self.minimum_size:
+                await self.send(self.initial_message)
+                await self.send(message)
+                self.passthrough = True
+                return
+
+            self.compressor = COMPRESSORS[self.encoding]()
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Encoding"] = self.encoding
+            message["body"] = await self.compress(body, final=not more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        message["body"] = await self.compress(body, final=not more_body)
+        await self.send(message)
@@ -1,5 +1,6 @@
 from src.database import Base
 from src.models.user import User
 from src.models.task import Task
+from src.models.task_archive import TaskArchive
 
-__all__ = ['Base', 'User', 'Task']
\ No newline at end of file
+__all__ = ['Base', 'User', 'Task', 'TaskArchive']
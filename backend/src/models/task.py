@@ -1,15 +1,23 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, Boolean
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, Boolean, Index, DateTime, text
 from sqlalchemy.orm import relationship
 from src.database import Base
 
 class Task(Base):
     __tablename__ = "tasks"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_tasks_user_id_position", "user_id", "position"),
+        # Поиск кандидатов на архивацию
+        Index("ix_tasks_completed_at", "completed_at", postgresql_where=text("completed")),
+        {'extend_existing': True},
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     completed = Column(Boolean, default=False)
+    completed_at = Column(DateTime)
+    # Дробный ключ порядка: сравнивается побайтово, поэтому collation "C"
+    position = Column(String(255, collation="C"), nullable=False)
 
     user = relationship("User", back_populates="tasks")
\ No newline at end of file
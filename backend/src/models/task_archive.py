@@ -0,0 +1,22 @@
+from datetime import datetime
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, Boolean, Index, DateTime
+from src.database import Base
+
+class TaskArchive(Base):
+    """Холодное хранилище выполненных задач, перенесённых из tasks"""
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        Index("ix_tasks_archive_user_id_position", "user_id", "position"),
+        {'extend_existing': True},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String(255), nullable=False)
+    description = Column(Text)
+    completed = Column(Boolean, default=True)
+    completed_at = Column(DateTime)
+    position = Column(String(255, collation="C"), nullable=False)
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    archived = True
@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert
+from src.models.task import Task
+from src.models.task_archive import TaskArchive
+
+ARCHIVED_COLUMNS = ["id", "user_id", "title", "description", "completed", "completed_at", "position"]
+
+
+def archive_statement(completed_before: datetime, batch_size: int):
+    """WITH moved AS (DELETE ... RETURNING) INSERT INTO tasks_archive SELECT ... FROM moved"""
+    batch = (
+        select(Task.id)
+        .filter(Task.completed.is_(True), Task.completed_at < completed_before)
+        .order_by(Task.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    moved = (
+        delete(Task)
+        .where(Task.id.in_(batch.scalar_subquery()))
+        .returning(*(getattr(Task, column) for column in ARCHIVED_COLUMNS))
+        .cte("moved")
+    )
+    return (
+        insert(TaskArchive)
+        .from_select(ARCHIVED_COLUMNS, select(*(moved.c[column] for column in ARCHIVED_COLUMNS)))
+        .returning(TaskArchive.id)
+    )
+
+
+class TaskArchiveRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_task(self, task_id: int) -> Optional[TaskArchive]:
+        result = await self.db.execute(select(TaskArchive).filter(TaskArchive.id == task_id))
+        return result.scalar_one_or_none()
+
+    async def get_user_tasks(self, user_id: int) -> List[TaskArchive]:
+        result = await self.db.execute(
+            select(TaskArchive)
+            .filter(TaskArchive.user_id == user_id)
+            .order_by(TaskArchive.position, TaskArchive.id)
+        )
+        return result.scalars().all()
+
+    async def archive_completed(self, completed_before: datetime, batch_size: int) -> int:
+        """Перенести одну пачку выполненных задач в архив одним запросом.
+
+        DELETE ... RETURNING и INSERT выполняются в одной транзакции, поэтому
+        прерванный прогон можно просто запустить заново. SKIP LOCKED позволяет
+        нескольким воркерам архивировать параллельно, не блокируя друг друга.
+        """
+        result = await self.db.execute(archive_statement(completed_before, batch_size))
+        archived = len(result.all())
+        await self.db.commit()
+        return archived
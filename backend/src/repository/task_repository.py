@@ -1,8 +1,11 @@
+from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from src.models.task import Task
+from src.models.user import User
 from src.dto.task import TaskCreate, TaskUpdate
+from src.utils.ordering import key_between, spread_keys
 
 class TaskRepository:
     def __init__(self, db: AsyncSession):
@@ -13,7 +16,8 @@ class TaskRepository:
             title=task_data.title,
             description=task_data.description,
             completed=False,
-            user_id=user_id
+            user_id=user_id,
+            position=await self._append_position(user_id)
         )
         self.db.add(db_task)
         await self.db.commit()
@@ -25,14 +29,83 @@ class TaskRepository:
         return result.scalar_one_or_none()
 
     async def get_user_tasks(self, user_id: int) -> List[Task]:
-        result = await self.db.execute(select(Task).filter(Task.user_id == user_id))
+        result = await self.db.execute(
+            select(Task).filter(Task.user_id == user_id).order_by(Task.position, Task.id)
+        )
         return result.scalars().all()
 
+    async def lock_user_positions(self, user_id: int) -> None:
+        """Сериализовать изменения порядка задач пользователя до конца транзакции.
+
+        Без блокировки два одновременных добавления или перемещения в один
+        промежуток получают одинаковый ключ. FOR NO KEY UPDATE не конфликтует
+        с FOR KEY SHARE, который берут проверки внешних ключей на users
+        (например, INSERT в tasks_archive у архиватора).
+        """
+        await self.db.execute(
+            select(User.id).where(User.id == user_id).with_for_update(key_share=True)
+        )
+
+    async def _append_position(self, user_id: int) -> str:
+        await self.lock_user_positions(user_id)
+        return key_between(await self.get_last_position(user_id), None)
+
+    async def get_last_position(self, user_id: int) -> Optional[str]:
+        result = await self.db.execute(
+            select(func.max(Task.position)).filter(Task.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_previous_position(self, user_id: int, position: str, exclude_id: int) -> Optional[str]:
+        """Позиция ближайшей задачи перед position (поиск по индексу (user_id, position))"""
+        result = await self.db.execute(
+            select(Task.position)
+            .filter(Task.user_id == user_id, Task.position < position, Task.id != exclude_id)
+            .order_by(Task.position.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_next_position(self, user_id: int, position: str, exclude_id: int) -> Optional[str]:
+        """Позиция ближайшей задачи после position (поиск по индексу (user_id, position))"""
+        result = await self.db.execute(
+            select(Task.position)
+            .filter(Task.user_id == user_id, Task.position > position, Task.id != exclude_id)
+            .order_by(Task.position)
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def set_task_position(self, task: Task, position: str) -> Task:
+        """Перемещение задачи: меняется ровно одна строка"""
+        task.position = position
+        await self.db.commit()
+        await self.db.refresh(task)
+        return task
+
+    async def rebalance_positions(self, user_id: int) -> None:
+        """Переписать ключи всех задач пользователя на короткие равномерные"""
+        await self.lock_user_positions(user_id)
+        result = await self.db.execute(
+            select(Task)
+            .filter(Task.user_id == user_id)
+            .order_by(Task.position, Task.id)
+            .with_for_update()
+        )
+        tasks = result.scalars().all()
+        for task, position in zip(tasks, spread_keys(len(tasks))):
+            task.position = position
+        await self.db.commit()
+
     async def update_task(self, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
         task = await self.get_task(task_id)
         if task:
             for key, value in task_data.dict(exclude_unset=True).items():
                 setattr(task, key, value)
+            if not task.completed:
+                task.completed_at = None
+            elif task.completed_at is None:
+                task.completed_at = datetime.utcnow()
             await self.db.commit()
             await self.db.refresh(task)
         return task
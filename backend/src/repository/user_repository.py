@@ -1,7 +1,8 @@
 from typing import Optional, List
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import selectinload
 from src.models.user import User
 from src.dto.user import UserCreate, UserUpdate
@@ -71,6 +72,17 @@ class UserRepository:
         user = await self.get_by_username(username)
         if not user:
             return None
-        if not verify_password(password, user.password_hash):
+        # Проверка хеша намеренно медленная - не блокируем event loop
+        if not await run_in_threadpool(verify_password, password, user.password_hash):
             return None
         return user
+
+    async def update_password_hash(self, user_id: int, old_hash: str, new_hash: str) -> bool:
+        """Заменить хеш, только если пароль не успели сменить"""
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id, User.password_hash == old_hash)
+            .values(password_hash=new_hash)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.dependencies import get_current_active_user
+from src.models.user import User
+from src.services.batch_service import BatchService
+from src.dto.batch import BatchRequest, BatchResponse
+from src.database import get_db
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+@router.post("", response_model=BatchResponse)
+async def execute_batch(
+    batch: BatchRequest,
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Выполнить несколько запросов к API за один HTTP-запрос"""
+    batch_service = BatchService(request, current_user, db)
+    try:
+        return await batch_service.execute(batch)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
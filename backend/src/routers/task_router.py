@@ -1,31 +1,34 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_active_user
 from src.models.user import User
-from src.services.task_service import TaskService
-from src.dto.task import Task, TaskCreate, TaskUpdate
+from src.services.task_service import TaskService, rebalance_task_positions
+from src.dto.task import Task, TaskCreate, TaskUpdate, TaskMove
 from src.database import get_db
+from src.config import settings
 
 router = APIRouter(prefix="/tasks")
 
 @router.get("/", response_model=List[Task])
 async def get_user_tasks(
+    include_archived: bool = False,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     task_service = TaskService(db)
-    return await task_service.get_user_tasks(current_user.id)
+    return await task_service.get_user_tasks(current_user.id, include_archived)
 
 @router.get("/{task_id}", response_model=Task)
 async def get_task(
     task_id: int,
+    include_archived: bool = False,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     task_service = TaskService(db)
-    task = await task_service.get_task(task_id)
+    task = await task_service.get_task(task_id, include_archived)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     if task.user_id != current_user.id:
@@ -36,11 +39,15 @@ async def get_task(
 @router.post("/", response_model=Task)
 async def create_task(
     task_data: TaskCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     task_service = TaskService(db)
-    return await task_service.create_task(task_data, current_user.id)
+    task = await task_service.create_task(task_data, current_user.id)
+    if len(task.position) > settings.task_position_max_length:
+        background_tasks.add_task(rebalance_task_positions, current_user.id)
+    return task
 
 
 @router.put("/{task_id}", response_model=Task)
@@ -58,6 +65,28 @@ async def update_task(
         raise HTTPException(status_code=403, detail="Not enough permissions")
     return await task_service.update_task(task_id, task_data)
 
+@router.post("/{task_id}/move", response_model=Task)
+async def move_task(
+    task_id: int,
+    move_data: TaskMove,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    task_service = TaskService(db)
+    task = await task_service.get_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if task.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    try:
+        task = await task_service.move_task(task, move_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(task.position) > settings.task_position_max_length:
+        background_tasks.add_task(rebalance_task_positions, current_user.id)
+    return task
+
 @router.delete("/{task_id}")
 async def delete_task(
     task_id: int,
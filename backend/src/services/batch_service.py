@@ -0,0 +1,137 @@
+import asyncio
+import json
+from typing import List, Optional, Tuple
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.dto.batch import BatchItem, BatchItemResponse, BatchRequest, BatchResponse
+from src.services.user_service import UserService
+
+
+class BatchService:
+    """Выполнение подзапросов /batch внутри процесса через ASGI-приложение.
+
+    Подзапросы получают уже аутентифицированного пользователя через scope
+    (см. get_current_user), а в последовательном режиме - ещё и общую сессию БД
+    (см. get_db), так что JWT декодируется и сессия берётся из пула один раз.
+    """
+
+    def __init__(self, request: Request, user, db: AsyncSession):
+        self.app = request.app
+        self.parent_scope = request.scope
+        self.user = user
+        self.db = db
+        # OAuth2PasswordBearer требует заголовок, сам токен повторно не проверяется
+        self.headers = [(b"authorization", request.headers.get("authorization", "").encode())]
+
+    async def execute(self, batch: BatchRequest) -> BatchResponse:
+        if len(batch.requests) > settings.batch_max_requests:
+            raise ValueError(f"Batch may contain at most {settings.batch_max_requests} requests")
+        for item in batch.requests:
+            if not item.path.startswith("/") or item.path.startswith("/batch"):
+                raise ValueError(f"Invalid batch request path: {item.path}")
+            if batch.concurrent and self._modifies_current_user(item):
+                raise ValueError("Requests that modify /users/me must run sequentially")
+
+        deadline = asyncio.get_running_loop().time() + settings.batch_timeout_seconds
+        if batch.concurrent:
+            semaphore = asyncio.Semaphore(settings.batch_max_concurrency)
+
+            async def run(item: BatchItem) -> BatchItemResponse:
+                async with semaphore:
+                    return await self._run(item, None, deadline)
+
+            responses = await asyncio.gather(*(run(item) for item in batch.requests))
+        else:
+            responses = []
+            for item in batch.requests:
+                if self.user is None:
+                    responses.append(BatchItemResponse(status=401, body={"detail": "User no longer exists"}))
+                    continue
+                response = await self._run(item, self.db, deadline)
+                responses.append(response)
+                if self._modifies_current_user(item) and response.status < 400:
+                    # Следующие подзапросы должны видеть обновлённого (или удалённого) пользователя
+                    self.user = await UserService(self.db).get_user_by_id(self.user.id)
+        return BatchResponse(responses=responses)
+
+    @staticmethod
+    def _modifies_current_user(item: BatchItem) -> bool:
+        path = item.path.partition("?")[0].rstrip("/")
+        return item.method != "GET" and path == "/users/me"
+
+    async def _run(self, item: BatchItem, db: Optional[AsyncSession], deadline: float) -> BatchItemResponse:
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining > 0:
+            try:
+                return await asyncio.wait_for(self._dispatch(item, db), remaining)
+            except asyncio.TimeoutError:
+                pass
+        return BatchItemResponse(status=504, body={"detail": "Batch timeout exceeded"})
+
+    async def _dispatch(self, item: BatchItem, db: Optional[AsyncSession]) -> BatchItemResponse:
+        path, _, query = item.path.partition("?")
+        body = b"" if item.body is None else json.dumps(item.body).encode()
+        headers = list(self.headers)
+        if body:
+            headers.append((b"content-type", b"application/json"))
+            headers.append((b"content-length", str(len(body)).encode()))
+
+        scope = {
+            "type": "http",
+            "asgi": self.parent_scope.get("asgi", {"version": "3.0"}),
+            "http_version": self.parent_scope.get("http_version", "1.1"),
+            "method": item.method,
+            "scheme": self.parent_scope.get("scheme", "http"),
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": self.parent_scope.get("root_path", ""),
+            "headers": headers,
+            "client": self.parent_scope.get("client"),
+            "server": self.parent_scope.get("server"),
+            "batch_user": self.user,
+        }
+        if db is not None:
+            scope["batch_session"] = db
+
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # Клиент подзапроса никогда не отключается
+            await asyncio.Event().wait()
+
+        status = 500
+        response_headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+
+        async def send(message):
+            nonlocal status, response_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = message.get("headers", [])
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            # ServerErrorMiddleware уже отправил 500 и пробрасывает исключение дальше
+            return BatchItemResponse(status=500, body={"detail": "Internal Server Error"})
+
+        return BatchItemResponse(status=status, body=self._decode_body(response_headers, b"".join(chunks)))
+
+    @staticmethod
+    def _decode_body(headers: List[Tuple[bytes, bytes]], body: bytes):
+        if not body:
+            return None
+        content_type = dict(headers).get(b"content-type", b"")
+        if content_type.startswith(b"application/json"):
+            return json.loads(body)
+        return body.decode(errors="replace")
@@ -1,23 +1,99 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.database import async_session
 from src.repository.task_repository import TaskRepository
-from src.dto.task import Task, TaskCreate, TaskUpdate
+from src.repository.task_archive_repository import TaskArchiveRepository
+from src.dto.task import Task, TaskCreate, TaskUpdate, TaskMove
+from src.models.task import Task as TaskModel
+from src.utils.ordering import key_between
+from src.utils.singleflight import SingleFlight
+
+_user_tasks_flight = SingleFlight("tasks.get_user_tasks")
+
+
+def _forget_user_tasks(user_id: int) -> None:
+    """После записи чтения списка задач должны идти в БД заново"""
+    _user_tasks_flight.forget((user_id, False))
+    _user_tasks_flight.forget((user_id, True))
+
 
 class TaskService:
     def __init__(self, db: AsyncSession):
         self.repository = TaskRepository(db)
+        self.archive_repository = TaskArchiveRepository(db)
 
     async def create_task(self, task_data: TaskCreate, user_id: int) -> Task:
-        return await self.repository.create_task(task_data, user_id)
+        task = await self.repository.create_task(task_data, user_id)
+        _forget_user_tasks(user_id)
+        return task
+
+    async def get_task(self, task_id: int, include_archived: bool = False) -> Optional[Task]:
+        task = await self.repository.get_task(task_id)
+        if task is None and include_archived:
+            task = await self.archive_repository.get_task(task_id)
+        return task
 
-    async def get_task(self, task_id: int) -> Optional[Task]:
-        return await self.repository.get_task(task_id)
+    async def get_user_tasks(self, user_id: int, include_archived: bool = False) -> List[Task]:
+        return await _user_tasks_flight.do(
+            (user_id, include_archived),
+            lambda: self._load_user_tasks(user_id, include_archived)
+        )
 
-    async def get_user_tasks(self, user_id: int) -> List[Task]:
-        return await self.repository.get_user_tasks(user_id)
+    async def _load_user_tasks(self, user_id: int, include_archived: bool) -> List[Task]:
+        tasks = await self.repository.get_user_tasks(user_id)
+        if include_archived:
+            tasks = list(tasks) + list(await self.archive_repository.get_user_tasks(user_id))
+        # Результат разделяется между запросами, поэтому отдаём DTO, а не объекты сессии
+        return [Task.model_validate(task, from_attributes=True) for task in tasks]
 
     async def update_task(self, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
-        return await self.repository.update_task(task_id, task_data)
+        task = await self.repository.update_task(task_id, task_data)
+        if task:
+            _forget_user_tasks(task.user_id)
+        return task
 
     async def delete_task(self, task_id: int) -> bool:
-        return await self.repository.delete_task(task_id)
+        task = await self.repository.get_task(task_id)
+        if not task:
+            return False
+        user_id = task.user_id
+        deleted = await self.repository.delete_task(task_id)
+        _forget_user_tasks(user_id)
+        return deleted
+
+    async def move_task(self, task: TaskModel, move_data: TaskMove) -> Task:
+        await self.repository.lock_user_positions(task.user_id)
+        after = await self._get_neighbour(task, move_data.after_id)
+        before = await self._get_neighbour(task, move_data.before_id)
+        if after is None and before is None:
+            raise ValueError("Either after_id or before_id must be provided")
+
+        if after is None:
+            lower = await self.repository.get_previous_position(task.user_id, before.position, task.id)
+        else:
+            lower = after.position
+        if before is None:
+            upper = await self.repository.get_next_position(task.user_id, after.position, task.id)
+        else:
+            upper = before.position
+
+        task = await self.repository.set_task_position(task, key_between(lower, upper))
+        _forget_user_tasks(task.user_id)
+        return task
+
+    async def _get_neighbour(self, task: TaskModel, neighbour_id: Optional[int]) -> Optional[TaskModel]:
+        if neighbour_id is None:
+            return None
+        if neighbour_id == task.id:
+            raise ValueError("Task cannot be its own neighbour")
+        neighbour = await self.repository.get_task(neighbour_id)
+        if not neighbour or neighbour.user_id != task.user_id:
+            raise ValueError(f"Neighbour task {neighbour_id} not found")
+        return neighbour
+
+
+async def rebalance_task_positions(user_id: int) -> None:
+    """Фоновая перебалансировка ключей порядка в собственной сессии"""
+    async with async_session() as session:
+        await TaskRepository(session).rebalance_positions(user_id)
+    _forget_user_tasks(user_id)
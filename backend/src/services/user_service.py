@@ -1,9 +1,22 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from src.database import async_session
 from src.repository.user_repository import UserRepository
 from src.dto.user import UserCreate, UserUpdate, UserResponse
 from src.models.user import User
 from src.auth.security import get_password_hash
+from src.utils.singleflight import SingleFlight
+
+_user_by_username_flight = SingleFlight("users.get_user_by_username")
+
+
+def _forget_usernames(*usernames: Optional[str]) -> None:
+    """После изменения или удаления пользователя поиск по имени должен идти в БД заново"""
+    for username in usernames:
+        if username:
+            _user_by_username_flight.forget(username)
+
 
 class UserService:
     def __init__(self, db: AsyncSession):
@@ -16,7 +29,7 @@ class UserService:
         if user_data.username and await self.repository.get_by_username(user_data.username):
             raise ValueError("User with this username already exists")
 
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
         user_data.password = hashed_password
 
         user = await self.repository.create(user_data)
@@ -29,6 +42,9 @@ class UserService:
         return UserResponse.model_validate(user)
 
     async def get_user_by_username(self, username: str) -> Optional[UserResponse]:
+        return await _user_by_username_flight.do(username, lambda: self._load_user_by_username(username))
+
+    async def _load_user_by_username(self, username: str) -> Optional[UserResponse]:
         user = await self.repository.get_by_username(username)
         if not user:
             return None
@@ -45,15 +61,28 @@ class UserService:
                 raise ValueError("User with this username already exists")
             
         if user_data.password:
-            user_data.password = get_password_hash(user_data.password)
+            user_data.password = await run_in_threadpool(get_password_hash, user_data.password)
+
+        existing_user = await self.repository.get_by_id(user_id)
+        if not existing_user:
+            return None
+        old_username = existing_user.username
 
         user = await self.repository.update(user_id, user_data)
         if not user:
             return None
+        _forget_usernames(old_username, user.username)
         return UserResponse.model_validate(user)
 
     async def delete_user(self, user_id: int) -> bool:
-        return await self.repository.delete(user_id)
+        user = await self.repository.get_by_id(user_id)
+        if not user:
+            return False
+        username = user.username
+        deleted = await self.repository.delete(user_id)
+        if deleted:
+            _forget_usernames(username)
+        return deleted
 
     async def list_users(self, skip: int = 0, limit: int = 100) -> List[UserResponse]:
         users = await self.repository.list_users(skip, limit)
@@ -61,4 +90,11 @@ class UserService:
 
     async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """Аутентификация пользователя"""
-        return await self.repository.authenticate_user(username, password) 
\ No newline at end of file
+        return await self.repository.authenticate_user(username, password)
+
+
+async def rehash_user_password(user_id: int, old_hash: str, password: str) -> None:
+    """Фоновое перехеширование пароля текущей схемой и стоимостью"""
+    new_hash = await run_in_threadpool(get_password_hash, password)
+    async with async_session() as session:
+        await UserRepository(session).update_password_hash(user_id, old_hash, new_hash)
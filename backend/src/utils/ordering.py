@@ -0,0 +1,62 @@
+from typing import List, Optional
+
+# Алфавит ключей упорядочен так же, как байты в ASCII (и в collation "C"),
+# поэтому строковое сравнение ключей совпадает с порядком задач.
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+_MIDDLE = DIGITS[BASE // 2]
+
+
+def _midpoint(lower: str, upper: Optional[str]) -> str:
+    """Ключ строго между lower и upper ("" - начало, None - конец списка)"""
+    if upper is not None:
+        prefix = 0
+        while (lower[prefix] if prefix < len(lower) else "0") == upper[prefix]:
+            prefix += 1
+        if prefix > 0:
+            return upper[:prefix] + _midpoint(lower[prefix:], upper[prefix:])
+
+    digit_lower = DIGITS.index(lower[0]) if lower else 0
+    if upper is None:
+        if not lower:
+            return _MIDDLE
+        # Добавление в конец: шагаем на одну цифру, чтобы ключ рос как можно медленнее
+        if digit_lower + 1 < BASE:
+            return DIGITS[digit_lower + 1]
+        return lower[0] + _midpoint(lower[1:], None)
+
+    digit_upper = DIGITS.index(upper[0])
+    if digit_upper - digit_lower > 1:
+        return DIGITS[(digit_lower + digit_upper) // 2]
+    if len(upper) > 1:
+        return upper[:1]
+    return DIGITS[digit_lower] + _midpoint(lower[1:], None)
+
+
+def key_between(lower: Optional[str], upper: Optional[str]) -> str:
+    """Сгенерировать ключ позиции между двумя соседями (None - край списка)"""
+    for key in (lower, upper):
+        if key is not None and (not key or key.endswith("0") or any(c not in DIGITS for c in key)):
+            raise ValueError(f"Invalid position key: {key!r}")
+    if lower is not None and upper is not None and lower >= upper:
+        raise ValueError("Neighbour positions are out of order")
+    return _midpoint(lower or "", upper)
+
+
+def spread_keys(count: int) -> List[str]:
+    """Равномерно распределённые ключи минимальной длины для count задач"""
+    width = 1
+    while BASE ** width <= count * 2:
+        width += 1
+    step = BASE ** width // (count + 1)
+
+    keys = []
+    for i in range(1, count + 1):
+        value = i * step
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        keys.append("".join(reversed(digits)).rstrip("0"))
+    return keys
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# Все экземпляры по имени - для метрик
+flights: Dict[str, "SingleFlight"] = {}
+
+
+class _LeaderCancelled(Exception):
+    """Запрос-лидер был отменён, ожидающие должны выполнить запрос сами"""
+
+
+class SingleFlight:
+    """Объединение одновременных одинаковых чтений в один запрос к БД.
+
+    Первый вызов по ключу (лидер) выполняет запрос, остальные, пришедшие пока
+    он в полёте, ждут и получают тот же результат или ту же ошибку. Отмена
+    ожидающего не влияет на остальных; если отменён лидер, ожидающие не
+    получают CancelledError, а повторяют запрос и один из них становится лидером.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        flights[name] = self
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        while key in self._calls:
+            try:
+                result = await asyncio.shield(self._calls[key])
+            except _LeaderCancelled:
+                continue
+            except Exception:
+                # Общая ошибка лидера - тоже объединённый вызов
+                self.coalesced += 1
+                raise
+            self.coalesced += 1
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        # Помечаем исключение прочитанным, даже если ожидающих не было
+        future.add_done_callback(lambda f: f.exception())
+        self._calls[key] = future
+        self.executions += 1
+        try:
+            result = await fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except BaseException:
+            # CancelledError и т.п. не передаём ожидающим
+            future.set_exception(_LeaderCancelled())
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def forget(self, key: Hashable) -> None:
+        """Не присоединять новые вызовы к текущему запросу по ключу.
+
+        Вызывается после записи: чтение, начатое после неё, не должно получить
+        результат запроса, стартовавшего до записи. Текущий лидер и его
+        ожидающие получат свой результат как обычно.
+        """
+        self._calls.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
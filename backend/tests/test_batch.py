@@ -0,0 +1,156 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.main import app
+from src.auth.dependencies import get_current_active_user
+from src.database import get_db
+from src.dto.user import UserResponse
+from fastapi.testclient import TestClient
+
+client = TestClient(app)
+
+
+async def override_get_db():
+    yield None
+
+def setup_module():
+    app.dependency_overrides[get_current_active_user] = lambda: UserResponse(id=1, username="alice")
+    app.dependency_overrides[get_db] = override_get_db
+
+def teardown_module():
+    app.dependency_overrides.clear()
+
+def test_batch_runs_sub_requests():
+    response = client.post(
+        "/batch",
+        json={"requests": [
+            {"method": "GET", "path": "/"},
+            {"method": "GET", "path": "/users/me"},
+            {"method": "GET", "path": "/missing"},
+        ]},
+        headers={"Authorization": "Bearer token"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"responses": [
+        {"status": 200, "body": {"message": "Hello!"}},
+        {"status": 200, "body": {"username": "alice", "id": 1}},
+        {"status": 404, "body": {"detail": "Not Found"}},
+    ]}
+
+def test_batch_rejects_nested_batch():
+    response = client.post(
+        "/batch",
+        json={"requests": [{"method": "POST", "path": "/batch"}]},
+        headers={"Authorization": "Bearer token"},
+    )
+    assert response.status_code == 400
+
+def test_failed_item_does_not_break_shared_session():
+    import src.database
+    from fastapi import Depends
+
+    class FakeSession:
+        needs_rollback = False
+
+        async def rollback(self):
+            self.needs_rollback = False
+
+        async def close(self):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            pass
+
+    session = FakeSession()
+
+    @app.post("/test-batch/fail")
+    async def fail(db=Depends(src.database.get_db)):
+        db.needs_rollback = True
+        raise RuntimeError("value too long for type character varying(255)")
+
+    @app.get("/test-batch/ok")
+    async def ok(db=Depends(src.database.get_db)):
+        if db.needs_rollback:
+            raise RuntimeError("PendingRollbackError")
+        return {"ok": True}
+
+    original_async_session = src.database.async_session
+    app.dependency_overrides.pop(get_db)
+    src.database.async_session = lambda: session
+    try:
+        response = client.post(
+            "/batch",
+            json={"requests": [
+                {"method": "POST", "path": "/test-batch/fail"},
+                {"method": "GET", "path": "/test-batch/ok"},
+            ]},
+            headers={"Authorization": "Bearer token"},
+        )
+    finally:
+        src.database.async_session = original_async_session
+        app.dependency_overrides[get_db] = override_get_db
+        app.router.routes = [r for r in app.router.routes if not getattr(r, "path", "").startswith("/test-batch")]
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["responses"]] == [500, 200]
+
+class StubUserService:
+    usernames = {}
+
+    def __init__(self, db):
+        pass
+
+    async def update_user(self, user_id, user_data):
+        self.usernames[user_id] = user_data.username
+        return UserResponse(id=user_id, username=user_data.username)
+
+    async def delete_user(self, user_id):
+        return self.usernames.pop(user_id, None) is not None
+
+    async def get_user_by_id(self, user_id):
+        if user_id not in self.usernames:
+            return None
+        return UserResponse(id=user_id, username=self.usernames[user_id])
+
+def stub_user_service(monkeypatch):
+    import src.routers.user_router
+    import src.services.batch_service
+    StubUserService.usernames = {1: "alice"}
+    monkeypatch.setattr(src.routers.user_router, "UserService", StubUserService)
+    monkeypatch.setattr(src.services.batch_service, "UserService", StubUserService)
+
+def test_batch_sees_renamed_user(monkeypatch):
+    stub_user_service(monkeypatch)
+    response = client.post(
+        "/batch",
+        json={"requests": [
+            {"method": "PUT", "path": "/users/me", "body": {"username": "bob"}},
+            {"method": "GET", "path": "/users/me"},
+        ]},
+        headers={"Authorization": "Bearer token"},
+    )
+    assert [item["body"]["username"] for item in response.json()["responses"]] == ["bob", "bob"]
+
+def test_batch_stops_acting_as_deleted_user(monkeypatch):
+    stub_user_service(monkeypatch)
+    response = client.post(
+        "/batch",
+        json={"requests": [
+            {"method": "DELETE", "path": "/users/me"},
+            {"method": "GET", "path": "/users/me"},
+        ]},
+        headers={"Authorization": "Bearer token"},
+    )
+    assert [item["status"] for item in response.json()["responses"]] == [204, 401]
+
+def test_concurrent_batch_rejects_user_writes():
+    response = client.post(
+        "/batch",
+        json={"concurrent": True, "requests": [{"method": "PUT", "path": "/users/me", "body": {}}]},
+        headers={"Authorization": "Bearer token"},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,50 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=100, offload_size=1000)
+
+@app.get("/small")
+def small():
+    return PlainTextResponse("x" * 10)
+
+@app.get("/large")
+def large():
+    return PlainTextResponse("x" * 5000)
+
+@app.get("/stream")
+def stream():
+    return StreamingResponse(iter(["chunk " * 100] * 5), media_type="text/plain")
+
+client = TestClient(app)
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip") == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("gzip;q=0.5, *;q=0.1") == "gzip"
+
+def test_small_response_is_not_compressed():
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "x" * 10
+
+def test_large_response_is_compressed():
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < 5000
+    assert response.text == "x" * 5000
+
+def test_streaming_response_is_compressed():
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == "chunk " * 500
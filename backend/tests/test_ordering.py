@@ -0,0 +1,33 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+import pytest
+
+from src.utils.ordering import key_between, spread_keys
+
+
+def test_key_between_keeps_order():
+    rng = random.Random(0)
+    keys = [key_between(None, None)]
+    for _ in range(500):
+        i = rng.randrange(len(keys) + 1)
+        lower = keys[i - 1] if i > 0 else None
+        upper = keys[i] if i < len(keys) else None
+        keys.insert(i, key_between(lower, upper))
+    assert keys == sorted(keys)
+    assert len(set(keys)) == len(keys)
+
+def test_key_between_rejects_bad_neighbours():
+    with pytest.raises(ValueError):
+        key_between("b", "a")
+    with pytest.raises(ValueError):
+        key_between("a0", None)
+
+def test_spread_keys():
+    keys = spread_keys(1000)
+    assert keys == sorted(keys)
+    assert len(set(keys)) == 1000
+    assert max(len(k) for k in keys) == 2
@@ -0,0 +1,31 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from src.auth.security import create_pwd_context
+
+
+def test_bcrypt_cost_change_requires_rehash():
+    old_context = create_pwd_context("bcrypt", bcrypt_rounds=4)
+    new_context = create_pwd_context("bcrypt", bcrypt_rounds=5)
+    hashed = old_context.hash("password123")
+
+    assert new_context.verify("password123", hashed)
+    assert new_context.needs_update(hashed)
+    assert not new_context.needs_update(new_context.hash("password123"))
+
+def test_bcrypt_hash_migrates_to_argon2():
+    pytest.importorskip("argon2")
+    bcrypt_context = create_pwd_context("bcrypt", bcrypt_rounds=4)
+    argon2_context = create_pwd_context("argon2", argon2_time_cost=1, argon2_memory_cost=1024, argon2_parallelism=1)
+    hashed = bcrypt_context.hash("password123")
+
+    assert argon2_context.verify("password123", hashed)
+    assert argon2_context.needs_update(hashed)
+    assert argon2_context.hash("password123").startswith("$argon2id$")
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(ValueError):
+        create_pwd_context("md5_crypt")
@@ -0,0 +1,124 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+
+import pytest
+
+from src.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_are_coalesced():
+    flight = SingleFlight("test.coalesce")
+    executions = 0
+
+    async def load():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert executions == 1
+    assert flight.stats() == {"calls": 5, "executions": 1, "coalesced": 4, "in_flight": 0}
+
+def test_errors_are_shared():
+    flight = SingleFlight("test.errors")
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db is down")
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.stats() == {"calls": 3, "executions": 1, "coalesced": 2, "in_flight": 0}
+
+def test_waiters_survive_leader_cancellation():
+    flight = SingleFlight("test.cancel")
+
+    async def load():
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        leader = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    assert asyncio.run(main()) == "result"
+    assert flight.stats()["executions"] == 2
+
+def test_forget_starts_new_flight():
+    flight = SingleFlight("test.forget")
+    results = iter(["before write", "after write"])
+
+    async def load():
+        result = next(results)
+        await asyncio.sleep(0.01)
+        return result
+
+    async def main():
+        before = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        flight.forget("key")
+        after = asyncio.create_task(flight.do("key", load))
+        return await before, await after
+
+    assert asyncio.run(main()) == ("before write", "after write")
+    assert flight.stats()["coalesced"] == 0
+
+def test_user_writes_forget_username_lookups():
+    from types import SimpleNamespace
+    from src.dto.user import UserUpdate
+    from src.services.user_service import UserService
+
+    user = SimpleNamespace(id=1, username="alice")
+    release = None
+
+    class StubUserRepository:
+        async def get_by_username(self, username):
+            # Чтение "видит" строку на момент начала запроса
+            found = user.username == username
+            if username == "alice" and not release.is_set():
+                await release.wait()
+            return SimpleNamespace(id=1, username=username) if found else None
+
+        async def get_by_id(self, user_id):
+            return user
+
+        async def update(self, user_id, user_data):
+            user.username = user_data.username
+            return user
+
+        async def delete(self, user_id):
+            return True
+
+    service = UserService(None)
+    service.repository = StubUserRepository()
+
+    async def main():
+        nonlocal release
+        release = asyncio.Event()
+        stale = asyncio.create_task(service.get_user_by_username("alice"))
+        await asyncio.sleep(0)
+        await service.update_user(1, UserUpdate(username="bob"))
+        fresh = asyncio.create_task(service.get_user_by_username("alice"))
+        await asyncio.sleep(0)
+        release.set()
+        return await stale, await fresh
+
+    stale, fresh = asyncio.run(main())
+    assert stale.username == "alice"
+    assert fresh is None
@@ -0,0 +1,107 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects import postgresql
+
+import src.jobs.archive_tasks as archive_tasks
+from src.dto.task import TaskUpdate
+from src.models.task import Task
+from src.models.task_archive import TaskArchive
+from src.repository.task_archive_repository import archive_statement
+from src.repository.task_repository import TaskRepository
+from src.services.task_service import TaskService
+
+
+class FakeSession:
+    async def commit(self):
+        pass
+
+    async def refresh(self, instance):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+def test_update_task_sets_and_clears_completed_at():
+    task = Task(id=1, user_id=1, title="t", description="", completed=False, position="V")
+    repository = TaskRepository(FakeSession())
+
+    async def get_task(task_id):
+        return task
+    repository.get_task = get_task
+
+    def update(completed):
+        return asyncio.run(repository.update_task(1, TaskUpdate(title="t", description="", completed=completed)))
+
+    update(True)
+    completed_at = task.completed_at
+    assert completed_at is not None
+    update(True)
+    assert task.completed_at == completed_at
+    update(False)
+    assert task.completed_at is None
+
+def test_load_user_tasks_merges_archived():
+    class StubRepository:
+        def __init__(self, tasks):
+            self.tasks = tasks
+
+        async def get_user_tasks(self, user_id):
+            return self.tasks
+
+    service = TaskService(None)
+    service.repository = StubRepository([
+        Task(id=1, user_id=1, title="live", description="", completed=False, position="V"),
+    ])
+    service.archive_repository = StubRepository([
+        TaskArchive(id=2, user_id=1, title="old", description="", completed=True, position="F"),
+    ])
+
+    live = asyncio.run(service._load_user_tasks(1, include_archived=False))
+    merged = asyncio.run(service._load_user_tasks(1, include_archived=True))
+
+    assert [(task.id, task.archived) for task in live] == [(1, False)]
+    assert [(task.id, task.archived) for task in merged] == [(1, False), (2, True)]
+
+def run_archiver(monkeypatch, batches, batch_size, max_batches=None):
+    calls = []
+    results = iter(batches)
+
+    class StubArchiveRepository:
+        def __init__(self, session):
+            pass
+
+        async def archive_completed(self, completed_before, size):
+            calls.append(size)
+            return next(results)
+
+    monkeypatch.setattr(archive_tasks, "async_session", FakeSession)
+    monkeypatch.setattr(archive_tasks, "TaskArchiveRepository", StubArchiveRepository)
+    total = asyncio.run(archive_tasks.archive_completed_tasks(timedelta(days=30), batch_size, max_batches))
+    return total, len(calls)
+
+def test_archiver_stops_on_short_batch(monkeypatch):
+    assert run_archiver(monkeypatch, [10, 10, 3, 10], batch_size=10) == (23, 3)
+
+def test_archiver_respects_max_batches(monkeypatch):
+    assert run_archiver(monkeypatch, [10, 10, 10], batch_size=10, max_batches=2) == (20, 2)
+
+def test_archive_statement_shape():
+    sql = " ".join(str(archive_statement(datetime(2026, 1, 1), 100).compile(
+        dialect=postgresql.dialect()
+    )).split())
+
+    assert sql.startswith("WITH moved AS (DELETE FROM tasks WHERE tasks.id IN (SELECT tasks.id FROM tasks")
+    assert "tasks.completed IS true AND tasks.completed_at <" in sql
+    assert "ORDER BY tasks.id LIMIT" in sql
+    assert "FOR UPDATE SKIP LOCKED) RETURNING tasks.id, tasks.user_id" in sql
+    assert "INSERT INTO tasks_archive (id, user_id, title, description, completed, completed_at, position, archived_at)" in sql
+    assert sql.endswith("FROM moved RETURNING tasks_archive.id")
@@ -0,0 +1,88 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.dto.task import TaskMove
+from src.services.task_service import TaskService
+
+
+class StubTaskRepository:
+    def __init__(self, tasks):
+        self.tasks = {task.id: task for task in tasks}
+        self.written = []
+
+    async def lock_user_positions(self, user_id):
+        pass
+
+    async def get_task(self, task_id):
+        return self.tasks.get(task_id)
+
+    async def get_previous_position(self, user_id, position, exclude_id):
+        positions = [t.position for t in self.tasks.values()
+                     if t.user_id == user_id and t.position < position and t.id != exclude_id]
+        return max(positions, default=None)
+
+    async def get_next_position(self, user_id, position, exclude_id):
+        positions = [t.position for t in self.tasks.values()
+                     if t.user_id == user_id and t.position > position and t.id != exclude_id]
+        return min(positions, default=None)
+
+    async def set_task_position(self, task, position):
+        task.position = position
+        self.written.append(task.id)
+        return task
+
+
+def make_service():
+    repository = StubTaskRepository([
+        SimpleNamespace(id=1, user_id=1, position="F"),
+        SimpleNamespace(id=2, user_id=1, position="V"),
+        SimpleNamespace(id=3, user_id=1, position="k"),
+        SimpleNamespace(id=4, user_id=2, position="V"),
+    ])
+    service = TaskService(None)
+    service.repository = repository
+    return service, repository
+
+def move(service, repository, task_id, **kwargs):
+    return asyncio.run(service.move_task(repository.tasks[task_id], TaskMove(**kwargs)))
+
+
+def test_move_after_uses_next_neighbour():
+    service, repository = make_service()
+    task = move(service, repository, 3, after_id=1)
+    assert "F" < task.position < "V"
+    assert repository.written == [3]
+
+def test_move_before_uses_previous_neighbour():
+    service, repository = make_service()
+    task = move(service, repository, 1, before_id=3)
+    assert "V" < task.position < "k"
+
+def test_move_between_both_neighbours():
+    service, repository = make_service()
+    task = move(service, repository, 3, after_id=1, before_id=2)
+    assert "F" < task.position < "V"
+
+def test_move_to_end():
+    service, repository = make_service()
+    task = move(service, repository, 1, after_id=3)
+    assert task.position > "k"
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"after_id": 2},
+    {"after_id": 4},
+    {"after_id": 99},
+    {"after_id": 3, "before_id": 1},
+])
+def test_invalid_moves_are_rejected(kwargs):
+    service, repository = make_service()
+    with pytest.raises(ValueError):
+        move(service, repository, 2, **kwargs)
+    assert repository.written == []